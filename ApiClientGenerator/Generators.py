@@ -1,20 +1,97 @@
 from __future__ import annotations
+import dataclasses
+import functools
 import logging
 import os
 import re
-from jinja2 import Template
-from typing import Any, Type
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from typing import Any, Iterable, Type
 from enum import Enum
 
 from . import Typing
 
+_SANITIZE_RE = re.compile(r'\W|^(?=\d)')
+# Drops the braces around path parameters in a single pass
+_BRACE_STRIP = str.maketrans("", "", "{}")
+
+# HTTP verbs in the declaration order of Typing.Methods
+_HTTP_METHODS = tuple(field.name for field in dataclasses.fields(Typing.Methods))
+
+# OpenAPI primitive types mapped to the type emitted by each generator
+_PY_PRIMITIVES = {
+    "object": "Dict[str, Any]",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "string": "str",
+}
+_JS_PRIMITIVES = {
+    "object": "Record<string, any>",
+    "integer": "number",
+    "number": "number",
+    "boolean": "boolean",
+    "string": "string",
+}
+
+# Source skeletons for a single generated client method, filled in with str.format
+_PY_METHOD_TEMPLATE = """
+    def {name}(self, {parameters}**kwargs) -> {output_type}:
+        response = self._request("{method}", "{path}".format({request_parameters}), **kwargs, response_model={response_model}, response_model_list={is_list})
+        return response"""
+_JS_METHOD_TEMPLATE = """
+    async {name}({parameters}config = {{}}) {{
+        const url = `${{this.baseUrl}}{path}`;
+        const response = await fetch(url, {{
+            method: "{method}",
+            ...config
+        }});
+        if (!response.ok) {{
+            throw new Error(`HTTP error! status: ${{response.status}}`);
+        }}
+        return response.json();
+    }}"""
+
+
+@functools.lru_cache(maxsize=None)
+def _sanitize(value: str) -> str:
+    # Schema names and ref tails repeat heavily across a spec, so cache the result
+    return _SANITIZE_RE.sub('_', value)
+
+
+@functools.lru_cache(maxsize=None)
+def _ref_name(ref: str) -> str:
+    # "#/components/schemas/Pet" -> "Pet", sanitized for use as a type name
+    return _sanitize(ref.rpartition('/')[2])
+
+
+@functools.lru_cache(maxsize=None)
+def get_env() -> Environment:
+    # Shared by every generator so each template is only loaded and compiled once per process.
+    # The bytecode cache (in the user's temp directory) also lets later runs skip compiling entirely.
+    return Environment(
+        loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates")),
+        bytecode_cache=FileSystemBytecodeCache(),
+        cache_size=-1,
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
 
 class Generator:
+    template_name: str
+
     def __init__(self, data: Typing.OpenAPI, template: Template, log:logging.Logger) -> None:
         self.data = data
         self.template = template
         self.logger = log
-        self.logger.debug(f"Initialized Generator with data: {data.info.title} and template: {template}")
+        self.logger.debug("Initialized Generator with data: %s and template: %s", data.info.title, template)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_template(cls, env: Environment | None = None) -> Template:
+        # Loaded and compiled once per (generator class, environment); defaults to the shared one
+        return (env or get_env()).get_template(cls.template_name)
 
     def set_logger_level(self, level: int) -> None:
         self.logger.setLevel(level)
@@ -22,11 +99,7 @@ class Generator:
     def generate(self) -> None:
         raise NotImplementedError
 
-    @staticmethod
-    def sanitize_string(value: str) -> str:
-        sanitized = re.sub(r'\W|^(?=\d)', '_', value)
-        # self.logger.debug(f"Sanitized string '{value}' to '{sanitized}'")
-        return sanitized
+    sanitize_string = staticmethod(_sanitize)
 
     @staticmethod
     def bind_enum_values(data: Any, response_model: Type) -> Any:
@@ -37,22 +110,44 @@ class Generator:
         return data
 
 class Python(Generator):
-    
-    reserved_python_words = [
+
+    template_name = "Python.jinja2"
+
+    reserved_python_words = frozenset({
         "False", "None", "True", "and", "as", "assert", "async", "await", "break", "class", "continue",
         "def", "del", "elif", "else", "except", "finally", "for", "from", "global", "if", "import",
         "in", "is", "lambda", "nonlocal", "not", "or", "pass", "raise", "return", "try", "while", "with", "yield"
-    ]
+    })
+    # Enum member names for values that collide with a reserved word
+    _reserved_prefix_map = {word: "_" + word for word in reserved_python_words}
+
+    imports = (
+        "from __future__ import annotations",
+        "import httpx",
+        "import json",
+        "from typing import Any, Dict, Optional, Union, List, TypeVar, Generic, Type",
+        "from enum import Enum",
+        "from dataclasses import dataclass",
+        "from dacite import from_dict, Config",
+    )
     
-    def __init__(self, data: Typing.OpenAPI, template: Template, log: logging.Logger, output_folder: str) -> None:
+    def __init__(self, data: Typing.OpenAPI, template: Template, log: logging.Logger, output_folder: str, slots: bool = False) -> None:
         super().__init__(data, template, log)
         self.output_folder = output_folder
-        self.logger.debug(f"Initialized Python generator with output folder: {output_folder}")
+        # Slotted dataclasses save memory per response model but need Python 3.10+ in the generated client
+        self.slots = slots
+        # The title never changes, so resolve where the client is written only once
+        self.output_dir = os.path.join(output_folder, Generator.sanitize_string(data.info.title))
+        self.client_path = os.path.join(self.output_dir, "client.py")
+        # Sanitize every schema name once up front; the type generator looks them up here
+        schemas = data.components.schemas if data.components else None
+        self.schema_names = {name: Generator.sanitize_string(name) for name in schemas or {}}
+        self.logger.debug("Initialized Python generator with output folder: %s", output_folder)
 
     def generate(self):
         self.logger.info("Starting Python client generation")
-        types_generator = Python.TypeGenerator(self.data, self.logger)
-        types_definitions, enums = types_generator.generate()
+        types_generator = Python.TypeGenerator(self.data, self.logger, self.schema_names, self.slots)
+        types_definitions, enums, enum_definitions = types_generator.generate()
         
         if not types_definitions:
             self.logger.warning("No types found")
@@ -64,51 +159,42 @@ class Python(Generator):
             self.logger.warning("No client code found")
             return None
         
-        self.save_client_and_types(client_code, types_definitions)
+        self.save_client_and_types(client_code, types_definitions, enum_definitions)
         self.logger.info("Python client generation completed")
         return client_code
 
-    def save_client_and_types(self, client_code, type_definitions):
-        os.makedirs(os.path.join(self.output_folder, Generator.sanitize_string(self.data.info.title)), exist_ok=True)
-        file_path = os.path.join(self.output_folder, Generator.sanitize_string(self.data.info.title), "client.py")
-        self.logger.debug(f"Saving client and types at {file_path}")
-        with open(file_path, "w") as file:
-            file.write(self.template.render(
-                Imports=[
-                    "from __future__ import annotations",
-                    "import httpx",
-                    "import json",
-                    "from typing import Any, Dict, Optional, Union, List, TypeVar, Generic, Type",
-                    "from enum import Enum",
-                    "from dataclasses import dataclass",
-                    "from dacite import from_dict, Config",
-                ],
-                Enum=self.generate_enums(),
-                DataClass="\n\n".join(type_definitions),
+    def save_client_and_types(self, client_code, type_definitions, enum_definitions):
+        os.makedirs(self.output_dir, exist_ok=True)
+        file_path = self.client_path
+        self.logger.debug("Saving client and types at %s", file_path)
+        # Stream the rendered template straight into a large write buffer instead of
+        # materialising the whole client in memory; encoded here, so no text-mode layer is needed
+        with open(file_path, "wb", buffering=1 << 20) as file:
+            self.template.stream(
+                Imports=self.imports,
+                Enum="\n\n".join(enum_definitions),
+                DataClass=type_definitions,
                 Methods=client_code
-            ))
-        self.logger.info(f"Client and types saved successfully at {file_path}")
-
-    def generate_enums(self):
-        enums = []
-        if self.data.components.schemas:
-            for name, schema in self.data.components.schemas.items():
-                if schema.enum:
-                    enum_name = Generator.sanitize_string(name)
-                    enum_values = "\n    ".join([f"{'_'+value if value in self.reserved_python_words else value} = '{value}'" for value in schema.enum])
-                    enums.append(f"class {enum_name}(Enum):\n    {enum_values}")
-        return "\n\n".join(enums)
+            ).dump(file, encoding="utf-8")
+        self.logger.info("Client and types saved successfully at %s", file_path)
 
     class TypeGenerator:
-        def __init__(self, data: Typing.OpenAPI, log:logging.Logger):
+        def __init__(self, data: Typing.OpenAPI, log:logging.Logger, schema_names: dict[str, str] | None = None, slots: bool = False):
             self.components = data.components
             self.logger = log
-            self.logger.debug(f"Initialized TypeGenerator with {len(self.components.schemas.keys())} components")
+            self.dataclass_decorator = "@dataclass(slots=True)" if slots else "@dataclass"
+            self._type_cache: dict[tuple[int, bool], str] = {}
+            if schema_names is None:
+                schema_names = {name: Generator.sanitize_string(name) for name in self.components.schemas or {}}
+            self.schema_names = schema_names
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Initialized TypeGenerator with %d components", len(self.components.schemas or ()))
 
         def generate(self):
             self.logger.info("Starting type generation")
             type_definitions = []
-            self.enums = self.detect_enums()
+            # Enum names must be known before generating any type that references them
+            self.enums, enum_definitions = self.generate_enums()
             
             if self.components.schemas:
                 for name, schema in self.components.schemas.items():
@@ -116,62 +202,62 @@ class Python(Generator):
             self.logger.info("Type generation completed")
 
             
-            return (type_definitions, self.enums,)
+            return (type_definitions, self.enums, enum_definitions,)
 
-        def detect_enums(self):
-            enums = []
-            if self.components.schemas:
-                for name, schema in self.components.schemas.items():
-                    if schema.enum:
-                        enum_name = Generator.sanitize_string(name)
-                        enums.append(enum_name)
-            return enums
+        def generate_enums(self):
+            # Collects the enum names and their class definitions in a single pass over the schemas
+            enum_names = set()
+            enum_definitions = []
+            member_name = Python._reserved_prefix_map.get
+            for name, schema in (self.components.schemas or {}).items():
+                if schema.enum:
+                    enum_name = self.schema_names[name]
+                    enum_names.add(enum_name)
+                    enum_values = "\n    ".join([f"{member_name(value, value)} = '{value}'" for value in schema.enum])
+                    enum_definitions.append(f"class {enum_name}(Enum):\n    {enum_values}")
+            return frozenset(enum_names), enum_definitions
 
         def generate_type(self, name, schema: Typing.Schema):
-            sanitized_name = Generator.sanitize_string(name)
-            self.logger.debug(f"Generating type for {sanitized_name}")
-            fields = []
+            sanitized_name = self.schema_names[name]
+            self.logger.debug("Generating type for %s", sanitized_name)
             if not schema.properties:
                 if schema.enum:
-                    self.logger.debug(f"Enum found in generation: {schema.enum = }")
+                    self.logger.debug("Enum found in generation: schema.enum = %r", schema.enum)
                     return ""
-                self.logger.warning(f"Schema {sanitized_name} has no properties")
-                return f"@dataclass\nclass {sanitized_name}:\n    pass"
+                self.logger.warning("Schema %s has no properties", sanitized_name)
+                return f"{self.dataclass_decorator}\nclass {sanitized_name}:\n    pass"
                 
-            for field_name, field in schema.properties.items():
-                fields.append(f"{field_name}: {self.get_field_type_from_property(field)}")
-            return f"""
-@dataclass
-class {sanitized_name}:
-    {f"\n    ".join(fields)}"""
+            fields = [f"{field_name}: {self.get_field_type_from_property(field)}" for field_name, field in schema.properties.items()]
+            return "".join(("\n", self.dataclass_decorator, "\nclass ", sanitized_name, ":\n    ", "\n    ".join(fields)))
             
-        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema):
+        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema, nullable_handled: bool = False):
+            # Shared schemas are resolved many times; the parsed spec is not mutated so identity is a safe key
+            key = (id(field), nullable_handled)
+            resolved = self._type_cache.get(key)
+            if resolved is None:
+                resolved = self._type_cache[key] = self._resolve_field_type(field, nullable_handled)
+            return resolved
+
+        def _resolve_field_type(self, field: Typing.Property|Typing.Schema, nullable_handled: bool):
             if field.enum:
-                self.logger.debug("Enum found in property detection: " + field.enum)
-            if isinstance(field, Typing.Schema):
+                self.logger.debug("Enum found in property detection: %s", field.enum)
+            if type(field) is Typing.Schema:
                 return self.get_field_type_from_property(field.properties)
-            if field.nullable:
-                field.nullable = False
-                return f"Optional[{self.get_field_type_from_property(field)}]"
+            if field.nullable and not nullable_handled:
+                return f"Optional[{self.get_field_type_from_property(field, nullable_handled=True)}]"
             if field.enum:
                 return "str"
             if field.ref:
-                if Generator.sanitize_string(field.ref.split('/')[-1]) in self.enums:
-                    self.logger.debug(f"Enum found in client property: {Generator.sanitize_string(field.ref.split('/')[-1]) = }")
+                ref_name = _ref_name(field.ref)
+                if ref_name in self.enums:
+                    self.logger.debug("Enum found in client property: %s", ref_name)
                     return "str"
-                return f"{Generator.sanitize_string(field.ref.split('/')[-1])}"
+                return ref_name
             if field.type == "array":
                 return f"List[{self.get_field_type_from_property(field.items)}]"
-            if field.type == "object":
-                return "Dict[str, Any]"
-            if field.type == "integer":
-                return "int"
-            if field.type == "number":
-                return "float"
-            if field.type == "boolean":
-                return "bool"
-            if field.type == "string":
-                return "str"
+            primitive = _PY_PRIMITIVES.get(field.type)
+            if primitive:
+                return primitive
             if field.allOf:
                 d = []
                 for i in field.allOf:
@@ -184,94 +270,106 @@ class {sanitized_name}:
         def __init__(self, data: Typing.OpenAPI, log:logging.Logger):
             self.data = data
             self.logger = log
-            self.logger.debug(f"Initialized ClientGenerator for application: {self.data.info.title}")
+            self._type_cache: dict[tuple[int, bool], str] = {}
+            self.logger.debug("Initialized ClientGenerator for application: %s", self.data.info.title)
 
-        def generate(self, enums: list[str]):
-            self.enums = enums
-            self.logger.info(f"Starting client generation for API {self.data.info.title}")
-            self.logger.debug(f"Enums found: {self.enums}")
+        def generate(self, enums: Iterable[str]):
+            # Checked for every $ref while resolving types, so store as a set for O(1) lookups
+            self.enums = frozenset(enums)
+            self.logger.info("Starting client generation for API %s", self.data.info.title)
+            self.logger.debug("Enums found: %s", self.enums)
             methods = self.generate_methods()
             client_code = "\n\n".join(methods)
-            self.logger.info(f"Client generation completed for API {self.data.info.title}")
+            self.logger.info("Client generation completed for API %s", self.data.info.title)
             return client_code
 
         def generate_methods(self):
             methods = []
             for path_url, path_item in self.data.paths.items():
-                for method in path_item.__dict__.keys():
-                    path = path_item.__dict__[method]
-                    if path:
-                        self.logger.debug(f"Generating method for {method.upper()} {path_url}")
-                        methods.append(self.generate_method(method.upper(), path_url, getattr(path_item, method)))
+                for method in _HTTP_METHODS:
+                    operation = getattr(path_item, method)
+                    if operation:
+                        self.logger.debug("Generating method for %s %s", method.upper(), path_url)
+                        methods.append(self.generate_method(method.upper(), path_url, operation))
             return methods
         
-        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema):
-            resp = None
-            if field.nullable:
-                field.nullable = False
-                resp = f"Optional[{self.get_field_type_from_property(field)}]"
+        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema, nullable_handled: bool = False):
+            key = (id(field), nullable_handled)
+            resolved = self._type_cache.get(key)
+            if resolved is None:
+                resolved = self._type_cache[key] = self._resolve_field_type(field, nullable_handled)
+            return resolved
+
+        def _resolve_field_type(self, field: Typing.Property|Typing.Schema, nullable_handled: bool):
+            if field.nullable and not nullable_handled:
+                resp = f"Optional[{self.get_field_type_from_property(field, nullable_handled=True)}]"
             elif field.ref:
+                ref_name = _ref_name(field.ref)
                 # Check if the ref is an enum
-                if Generator.sanitize_string(field.ref.split('/')[-1]) in self.enums:
-                    self.logger.debug(f"Enum found in client property: {Generator.sanitize_string(field.ref.split('/')[-1]) = }")
+                if ref_name in self.enums:
+                    self.logger.debug("Enum found in client property: %s", ref_name)
                     resp = "str"
                 else:
-                    resp = f"{Generator.sanitize_string(field.ref.split('/')[-1])}"
+                    resp = ref_name
             elif field.type == "array":
                 resp = f"List[{self.get_field_type_from_property(field.items)}]"
-            elif field.type == "object":
-                resp = "Dict[str, Any]"
-            elif field.type == "integer":
-                resp = "int"
-            elif field.type == "number":
-                resp = "float"
-            elif field.type == "boolean":
-                resp = "bool"
-            if resp is None:
-                resp = "str"
-
-            self.logger.debug(f"Field type: {resp} for {field.enum = } {field.ref = } {field.type = }")
+            else:
+                resp = _PY_PRIMITIVES.get(field.type, "str")
+
+            self.logger.debug("Field type: %s for field.enum = %r field.ref = %r field.type = %r", resp, field.enum, field.ref, field.type)
             return resp
         
-        def get_preferred_output_type(self, operation: Typing.Operation):
-            output_type = "Any"
-            preferred_output_type = operation.responses.get("200") or operation.responses.get("default")
-            response_content = preferred_output_type.content.get("application/json") if preferred_output_type and preferred_output_type.content else None
-            if response_content:
-                output_type = self.get_field_type_from_property(response_content["schema"])
-            return output_type
+        def get_preferred_output_type(self, operation: Typing.Operation) -> tuple[str, str, bool]:
+            # Returns the annotated output type, the model passed to _request and whether the response is a list
+            responses = operation.responses
+            preferred_output_type = responses.get("200") or responses.get("default")
+            if not preferred_output_type or not preferred_output_type.content:
+                return "Any", "Any", False
+            response_content = preferred_output_type.content.get("application/json")
+            if not response_content:
+                return "Any", "Any", False
+            schema = response_content["schema"]
+            if schema.type == "array" and not schema.nullable:
+                item_type = self.get_field_type_from_property(schema.items)
+                return f"List[{item_type}]", item_type, True
+            output_type = self.get_field_type_from_property(schema)
+            return output_type, output_type, False
 
         def generate_method(self, method: str, path: str, operation: Typing.Operation):
-            sanitized_path = Generator.sanitize_string(path.replace("{", "").replace("}", ""))
+            sanitized_path = Generator.sanitize_string(path.translate(_BRACE_STRIP))
             sanitized_path = f"{method.lower()}_{sanitized_path.removeprefix('_')}"
             
-            input_parameters_list = []
-            for i in operation.parameters or []:
-                input_parameters_list.append(f"{i.name}: {self.get_field_type_from_property(i.schema)}")
+            parameter_names = []
+            request_arguments = []
+            for parameter in operation.parameters or ():
+                parameter_names.append(parameter.name)
+                request_arguments.append(f"{parameter.name}={parameter.name}")
+            input_parameters = ", ".join(parameter_names)
+            request_parameters = ", ".join(request_arguments)
             
-            input_parameters = ", ".join([param.name for param in operation.parameters]) if operation.parameters else ""
-            request_parameters = ", ".join([f"{param.name}={param.name}" for param in operation.parameters]) if operation.parameters else ""
-            
-            self.logger.debug(f"Generated method {sanitized_path} with parameters: {input_parameters}")
-            output_type = self.get_preferred_output_type(operation)
-            
-            if "List[" in output_type:
-                is_list = True
-                output_type2 = output_type.replace("List[", "").replace("]", "")
-            else:
-                is_list = False
-                output_type2 = output_type
+            self.logger.debug("Generated method %s with parameters: %s", sanitized_path, input_parameters)
+            output_type, response_model, is_list = self.get_preferred_output_type(operation)
             
-            return f"""
-    def {sanitized_path}(self, {input_parameters + ", " if input_parameters else ""}**kwargs) -> {output_type}:
-        response = self._request("{method}", "{path}".format({request_parameters}), **kwargs, response_model={output_type2.replace("'", "")}, response_model_list={is_list})
-        return response"""
+            return _PY_METHOD_TEMPLATE.format(
+                name=sanitized_path,
+                parameters=input_parameters + ", " if input_parameters else "",
+                output_type=output_type,
+                method=method,
+                path=path,
+                request_parameters=request_parameters,
+                response_model=response_model,
+                is_list=is_list,
+            )
 
 class JavaScript(Generator):
+    template_name = "Javascript.jinja2"
+
     def __init__(self, data: Typing.OpenAPI, template: Template, log: logging.Logger, output_folder: str) -> None:
         super().__init__(data, template, log)
         self.output_folder = output_folder
-        self.logger.debug(f"Initialized JavaScript generator with output folder: {output_folder}")
+        self.output_dir = os.path.join(output_folder, Generator.sanitize_string(data.info.title))
+        self.client_path = os.path.join(self.output_dir, "client.js")
+        self.logger.debug("Initialized JavaScript generator with output folder: %s", output_folder)
 
     def generate(self):
         self.logger.info("Starting JavaScript client generation")
@@ -293,22 +391,24 @@ class JavaScript(Generator):
         return client_code
 
     def save_client_and_types(self, client_code, type_definitions):
-        os.makedirs(os.path.join(self.output_folder, Generator.sanitize_string(self.data.info.title)), exist_ok=True)
-        file_path = os.path.join(self.output_folder, Generator.sanitize_string(self.data.info.title), "client.js")
-        self.logger.debug(f"Saving client and types at {file_path}")
-        with open(file_path, "w") as file:
-            file.write(self.template.render(
+        os.makedirs(self.output_dir, exist_ok=True)
+        file_path = self.client_path
+        self.logger.debug("Saving client and types at %s", file_path)
+        with open(file_path, "wb", buffering=1 << 20) as file:
+            self.template.stream(
                 Imports=[],
-                Types="\n\n".join(type_definitions),
+                Types=type_definitions,
                 Methods=client_code
-            ))
-        self.logger.info(f"Client and types saved successfully at {file_path}")
+            ).dump(file, encoding="utf-8")
+        self.logger.info("Client and types saved successfully at %s", file_path)
 
     class TypeGenerator:
         def __init__(self, data: Typing.OpenAPI, log:logging.Logger):
             self.components = data.components
             self.logger = log
-            self.logger.debug(f"Initialized TypeGenerator with components: {self.components}")
+            self._type_cache: dict[tuple[int, bool], str] = {}
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Initialized TypeGenerator with %d components", len(self.components.schemas or ()))
 
         def generate(self):
             self.logger.info("Starting type generation")
@@ -321,39 +421,33 @@ class JavaScript(Generator):
 
         def generate_type(self, name, schema: Typing.Schema):
             sanitized_name = Generator.sanitize_string(name)
-            self.logger.debug(f"Generating type for {sanitized_name}")
-            fields = []
+            self.logger.debug("Generating type for %s", sanitized_name)
             if not schema.properties:
-                self.logger.warning(f"Schema {sanitized_name} has no properties")
+                self.logger.warning("Schema %s has no properties", sanitized_name)
                 return f"class {sanitized_name} {{}}"
                 
-            for field_name, field in schema.properties.items():
-                fields.append(f"{field_name};")
-            return f"""
-class {sanitized_name} {{
-    {f"\n    ".join(fields)}
-}}"""
+            fields = [f"{field_name};" for field_name in schema.properties]
+            return "".join(("\nclass ", sanitized_name, " {\n    ", "\n    ".join(fields), "\n}"))
             
-        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema):
-            if isinstance(field, Typing.Schema):
+        def get_field_type_from_property(self, field: Typing.Property|Typing.Schema, nullable_handled: bool = False):
+            key = (id(field), nullable_handled)
+            resolved = self._type_cache.get(key)
+            if resolved is None:
+                resolved = self._type_cache[key] = self._resolve_field_type(field, nullable_handled)
+            return resolved
+
+        def _resolve_field_type(self, field: Typing.Property|Typing.Schema, nullable_handled: bool):
+            if type(field) is Typing.Schema:
                 return self.get_field_type_from_property(field.properties)
-            if field.nullable:
-                field.nullable = False
-                return f"{self.get_field_type_from_property(field)} | null"
+            if field.nullable and not nullable_handled:
+                return f"{self.get_field_type_from_property(field, nullable_handled=True)} | null"
             if field.ref:
-                return f"{Generator.sanitize_string(field.ref.split('/')[-1])}"
+                return _ref_name(field.ref)
             if field.type == "array":
                 return f"Array<{self.get_field_type_from_property(field.items)}>"
-            if field.type == "object":
-                return "Record<string, any>"
-            if field.type == "integer":
-                return "number"
-            if field.type == "number":
-                return "number"
-            if field.type == "boolean":
-                return "boolean"
-            if field.type == "string":
-                return "string"
+            primitive = _JS_PRIMITIVES.get(field.type)
+            if primitive:
+                return primitive
             if field.allOf:
                 d = []
                 for i in field.allOf:
@@ -366,76 +460,64 @@ class {sanitized_name} {{
         def __init__(self, data: Typing.OpenAPI, log:logging.Logger):
             self.data = data
             self.logger = log
-            self.logger.debug(f"Initialized ClientGenerator with data: {self.data}")
+            self._type_cache: dict[tuple[int, bool], str] = {}
+            self.logger.debug("Initialized ClientGenerator for application: %s", self.data.info.title)
 
         def generate(self):
-            self.logger.info(f"Starting client generation for API {self.data.info.title}")
+            self.logger.info("Starting client generation for API %s", self.data.info.title)
             methods = self.generate_methods()
             client_code = "\n\n".join(methods)
-            self.logger.info(f"Client generation completed for API {self.data.info.title}")
+            self.logger.info("Client generation completed for API %s", self.data.info.title)
             return client_code
 
         def generate_methods(self):
             methods = []
             for path_url, path_item in self.data.paths.items():
-                for method in path_item.__dict__.keys():
-                    path = path_item.__dict__[method]
-                    if path:
-                        self.logger.debug(f"Generating method for {method.upper()} {path_url}")
-                        methods.append(self.generate_method(method.upper(), path_url, getattr(path_item, method)))
+                for method in _HTTP_METHODS:
+                    operation = getattr(path_item, method)
+                    if operation:
+                        self.logger.debug("Generating method for %s %s", method.upper(), path_url)
+                        methods.append(self.generate_method(method.upper(), path_url, operation))
             return methods
         
-        def get_field_type_from_property(self, field: Typing.Property):
-            if field.nullable:
-                field.nullable = False
-                return f"{self.get_field_type_from_property(field)} | null"
+        def get_field_type_from_property(self, field: Typing.Property, nullable_handled: bool = False):
+            key = (id(field), nullable_handled)
+            resolved = self._type_cache.get(key)
+            if resolved is None:
+                resolved = self._type_cache[key] = self._resolve_field_type(field, nullable_handled)
+            return resolved
+
+        def _resolve_field_type(self, field: Typing.Property, nullable_handled: bool):
+            if field.nullable and not nullable_handled:
+                return f"{self.get_field_type_from_property(field, nullable_handled=True)} | null"
             if field.enum:
                 return "string"
             if field.ref:
-                return f"{Generator.sanitize_string(field.ref.split('/')[-1])}"
+                return _ref_name(field.ref)
             if field.type == "array":
                 return f"Array<{self.get_field_type_from_property(field.items)}>"
-            if field.type == "object":
-                return "Record<string, any>"
-            if field.type == "integer":
-                return "number"
-            if field.type == "number":
-                return "number"
-            if field.type == "boolean":
-                return "boolean"
-            return "string"
+            return _JS_PRIMITIVES.get(field.type, "string")
         
         def get_preferred_output_type(self, operation: Typing.Operation):
-            output_type = "any"
-            preferred_output_type = operation.responses.get("200") or operation.responses.get("default")
-            response_content = preferred_output_type.content.get("application/json") if preferred_output_type and preferred_output_type.content else None
-            if response_content:
-                output_type = self.get_field_type_from_property(response_content["schema"])
-            return output_type
+            responses = operation.responses
+            preferred_output_type = responses.get("200") or responses.get("default")
+            if not preferred_output_type or not preferred_output_type.content:
+                return "any"
+            response_content = preferred_output_type.content.get("application/json")
+            return self.get_field_type_from_property(response_content["schema"]) if response_content else "any"
 
         def generate_method(self, method: str, path: str, operation: Typing.Operation):
-            sanitized_path = Generator.sanitize_string(path.replace("{", "").replace("}", ""))
+            sanitized_path = Generator.sanitize_string(path.translate(_BRACE_STRIP))
             sanitized_path = f"{method.lower()}_{sanitized_path.removeprefix('_')}"
             
             path = path.replace("{", "${")
             
-            input_parameters_list = []
-            for i in operation.parameters or []:
-                input_parameters_list.append(f"{i.name}")
-            
-            input_parameters = ", ".join([param.name for param in operation.parameters]) if operation.parameters else ""
-            request_parameters = ", ".join([f"{param.name}={param.name}" for param in operation.parameters]) if operation.parameters else ""
+            input_parameters = ", ".join([parameter.name for parameter in operation.parameters or ()])
             
-            self.logger.debug(f"Generated method {sanitized_path} with parameters: {input_parameters}")
-            return f"""
-    async {sanitized_path}({input_parameters + ", " if input_parameters else ""}config = {{}}) {{
-        const url = `{'${this.baseUrl}'}{path}`;
-        const response = await fetch(url, {{
-            method: "{method}",
-            ...config
-        }});
-        if (!response.ok) {{
-            throw new Error(`HTTP error! status: ${'{response.status}'}`);
-        }}
-        return response.json();
-    }}"""
+            self.logger.debug("Generated method %s with parameters: %s", sanitized_path, input_parameters)
+            return _JS_METHOD_TEMPLATE.format(
+                name=sanitized_path,
+                parameters=input_parameters + ", " if input_parameters else "",
+                method=method,
+                path=path,
+            )
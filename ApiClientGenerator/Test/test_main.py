@@ -1,21 +1,25 @@
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
+import os
+import json
+import tempfile
 import main
 from Generators import Python
-import json
 
 class TestMain(unittest.TestCase):
-    
+
     def setUp(self) -> None:
-        pass
-    
-    @patch('builtins.open', new_callable=mock_open, read_data="{}")
+        self.settings = main.Settings()
+        self.settings.Python = {"*": True}
+        self.settings.Javascript = {}
+
+    @patch('builtins.open', new_callable=mock_open, read_data=b"{}")
     @patch('main.P')
-    @patch("json.load")
-    @patch("main.glob", return_value=["ToBeGenerated/test.json"])
-    def test_main(self, mock_glob:MagicMock, mock_json_load: MagicMock, Python_Generator: MagicMock, mock_open:MagicMock) -> None:
-        
-        mock_json_load.return_value = {
+    @patch("main.json_loads")
+    @patch("main._list_specs", return_value=["ToBeGenerated/test.json"])
+    def test_main(self, mock_list_specs:MagicMock, mock_json_loads: MagicMock, Python_Generator: MagicMock, mock_open:MagicMock) -> None:
+
+        mock_json_loads.return_value = {
             "openapi": "3.0.0",
             "info": {
                 "title": "API",
@@ -59,17 +63,32 @@ class TestMain(unittest.TestCase):
             }
         }
 
-        mock_open.return_value.read.return_value = json.dumps(mock_json_load.return_value)
-
         mock_generator_instance = MagicMock(spec=Python)
         Python_Generator.return_value = mock_generator_instance
 
-        main.main()
+        main.main(settings=self.settings)
 
-        mock_open.assert_any_call('ToBeGenerated/test.json', 'r')
-        mock_open.assert_any_call('templates/Python.jinja2', 'r')
+        mock_list_specs.assert_called_once_with("ToBeGenerated")
+        mock_open.assert_any_call('ToBeGenerated/test.json', 'rb')
+        mock_json_loads.assert_called_once_with(b"{}")
+        # Templates come from the shared Jinja environment, not from open()
+        for call in mock_open.call_args_list:
+            self.assertFalse(str(call.args[0]).endswith(".jinja2"))
         mock_generator_instance.generate.assert_called_once()
 
+    @patch('main.P')
+    @patch("main.json_loads")
+    @patch("main._list_specs", return_value=["ToBeGenerated/test.json"])
+    def test_main_skips_disabled_specs(self, mock_list_specs: MagicMock, mock_json_loads: MagicMock, Python_Generator: MagicMock) -> None:
+        settings = main.Settings()
+        settings.Python = {"other": True}
+        settings.Javascript = {}
+
+        main.main(settings=settings)
+
+        mock_json_loads.assert_not_called()
+        Python_Generator.assert_not_called()
+
     def test_ref_key_transformer(self):
         data = {
             "$ref": "some_ref",
@@ -90,13 +109,17 @@ class TestMain(unittest.TestCase):
         }
         self.assertEqual(transformed_data, expected_data)
 
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('main.P')
-    @patch("json.load")
-    @patch("main.glob", return_value=["ToBeGenerated/test.json"])
-    @patch("main.P.TypeGenerator")
-    def test_generate_api_client(self, python_typeGenerator:MagicMock, mock_glob: MagicMock, mock_json_load: MagicMock, Python_Generator: MagicMock, mock_open: MagicMock) -> None:
-        mock_json_load.return_value = {
+    def test_list_specs(self):
+        with tempfile.TemporaryDirectory() as input_folder:
+            for name in ("a.json", ".hidden.json", "notes.txt"):
+                open(os.path.join(input_folder, name), "w").close()
+            os.mkdir(os.path.join(input_folder, "folder.json"))
+
+            self.assertEqual(main._list_specs(input_folder), [os.path.join(input_folder, "a.json")])
+            self.assertEqual(main._list_specs(os.path.join(input_folder, "missing")), [])
+
+    def test_generate_api_client(self) -> None:
+        spec = {
             "openapi": "3.0.0",
             "info": {
                 "title": "API",
@@ -108,7 +131,14 @@ class TestMain(unittest.TestCase):
                         "summary": "Example endpoint",
                         "responses": {
                             "200": {
-                                "description": "Successful response"
+                                "description": "Successful response",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {
+                                            "$ref": "#/components/schemas/Example"
+                                        }
+                                    }
+                                }
                             }
                         }
                     }
@@ -128,41 +158,29 @@ class TestMain(unittest.TestCase):
             }
         }
 
-        mock_open.return_value.read.return_value = json.dumps(mock_json_load.return_value)
+        with tempfile.TemporaryDirectory() as folder:
+            file = os.path.join(folder, "test.json")
+            with open(file, "w") as f:
+                json.dump(spec, f)
+            output_folder = os.path.join(folder, "Output")
 
-        mock_generator_instance = MagicMock(spec=Python)
-        mock_generator_instance:Python = Python_Generator.return_value
-
-        main.main()
+            main.generate_file(file, output_folder, True, False)
 
-        mock_open.assert_any_call('ToBeGenerated/test.json', 'r')
-        mock_open.assert_any_call('templates/Python.jinja2', 'r')
-        mock_open.assert_any_call("Output/API/ApiClient.py", "w")
-        
-        # Check if the generators is called
-        mock_generator_instance.generate.assert_called_once()
-        
-        
-        # Check if the file is correctly written
-        mock_open.assert_any_call("Output/API/client.py", "w").write.assert_called_once()
+            # Check if the file is correctly written
+            with open(os.path.join(output_folder, "API", "client.py"), "r") as f:
+                output = f.read()
 
         # Check if the output is correct
-        output = mock_open.assert_any_call("Output/API/client.py", "w").write.call_args.args[0]
-        functions_file_path = 'ApiClientGenerator/Output/API/ApiClient.py'
-        with open(functions_file_path, "r") as f:
-            expected_output = f.read()
-        
-        self.assertEqual(output, expected_output)
-
-    @patch('main.glob')
-    @patch('main.os.makedirs')
-    @patch('builtins.open', new_callable=mock_open, read_data="{}")
+        self.assertIn("@dataclass\nclass Example:\n    name: str", output)
+        self.assertIn("def get_example(self, **kwargs) -> Example:", output)
+        self.assertIn('response_model=Example, response_model_list=False', output)
+
+    @patch('builtins.open', new_callable=mock_open, read_data=b"{}")
     @patch('main.P')
-    @patch("json.load")
-    @patch("Generators.os")
-    def test_main_with_custom_folders(self, mock_generators_mock:MagicMock, mock_json_load: MagicMock, Python_Generator: MagicMock, mock_open: MagicMock, mock_makedirs: MagicMock, mock_glob: MagicMock) -> None:
-        mock_glob.return_value = ["custom_input/test.json"]
-        mock_json_load.return_value = {
+    @patch("main.json_loads")
+    @patch("main._list_specs", return_value=["custom_input/test.json"])
+    def test_main_with_custom_folders(self, mock_list_specs: MagicMock, mock_json_loads: MagicMock, Python_Generator: MagicMock, mock_open: MagicMock) -> None:
+        mock_json_loads.return_value = {
             "openapi": "3.0.0",
             "info": {
                 "title": "API",
@@ -182,22 +200,15 @@ class TestMain(unittest.TestCase):
             }
         }
 
-        mock_open.return_value.read.return_value = json.dumps(mock_json_load.return_value)
-
         mock_generator_instance = MagicMock(spec=Python)
-        mock_generators_mock.os.path.exists.return_value = False
-        
         Python_Generator.return_value = mock_generator_instance
-        
-        mock_generators_mock.os.path.join = lambda *args: "/".join(args)
-        
 
-        main.main(input_folder="custom_input", output_folder="custom_output")
+        main.main(input_folder="custom_input", output_folder="custom_output", settings=self.settings)
 
-        mock_open.assert_any_call('custom_input/test.json', 'r')
-        mock_open.assert_any_call('templates/Python.jinja2', 'r')
+        mock_list_specs.assert_called_once_with("custom_input")
+        mock_open.assert_any_call('custom_input/test.json', 'rb')
         mock_generator_instance.generate.assert_called_once()
-        mock_generators_mock.os.open.assert_any_call("custom_output/API/client.py", "w")
+        self.assertEqual(Python_Generator.call_args.args[3], "custom_output")
 
 if __name__ == '__main__':
     unittest.main()
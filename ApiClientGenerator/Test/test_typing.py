@@ -1,6 +1,8 @@
+import pickle
 import unittest
 from Typing import Contact, License, Info, Tags, Response, ServerVariable, Server, ExternalDocumentation, Tag, Reference, Property, Schema, Parameter, Operation, Path, Components, Methods, OpenAPI
 from dacite import from_dict, Config
+from Typing_codegen import builders, build_OpenAPI, MissingFieldError
 
 
 class TestTyping(unittest.TestCase):
@@ -146,5 +148,41 @@ class TestTyping(unittest.TestCase):
         self.assertEqual(openapi.tags, None)
         self.assertEqual(openapi.externalDocs, None)
 
+class TestTypingCodegen(unittest.TestCase):
+
+    def test_openapi_missing_optional_keys(self):
+        data = {"openapi": "3.0.0", "info": {"title": "API", "version": "1.0.0"}, "paths": {"/path": {"get": {"summary": "Path summary"}}}}
+        self.assertEqual(build_OpenAPI(data), from_dict(data_class=OpenAPI, data=data))
+
+    def test_openapi_explicit_nulls(self):
+        data = {"openapi": "3.0.0", "info": {"title": "API", "description": None, "termsOfService": None, "contact": None, "license": None, "version": "1.0.0"}, "servers": None, "paths": {"/path": {"get": None, "put": None, "post": None, "delete": None, "options": None, "head": None, "patch": None, "trace": None}}, "components": None, "security": None, "tags": None, "externalDocs": None}
+        self.assertEqual(build_OpenAPI(data), from_dict(data_class=OpenAPI, data=data))
+
+    def test_operation_defaults(self):
+        self.assertEqual(builders[Operation]({}), from_dict(data_class=Operation, data={}))
+        data = {"summary": "Operation summary", "parameters": [{"in_": "query", "name": "param"}], "responses": {"200": {"description": "Response description"}}}
+        self.assertEqual(builders[Operation](data), from_dict(data_class=Operation, data=data))
+
+    def test_response_content(self):
+        data = {"description": "Response description", "content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string"}, "items": {"type": "array", "items": {"ref": "#/components/schemas/Schema"}}}}}}}
+        response = builders[Response](data)
+        self.assertEqual(response, from_dict(data_class=Response, data=data))
+        self.assertIsInstance(response.content["application/json"]["schema"], Schema)
+        self.assertIsInstance(response.content["application/json"]["schema"].properties["items"].items, Property)
+
+    def test_missing_required_key(self):
+        data = {"openapi": "3.0.0", "info": {"title": "API"}, "paths": {}}
+        with self.assertRaises(MissingFieldError) as context:
+            build_OpenAPI(data)
+        self.assertEqual(str(context.exception), 'missing value for field "Info.version"')
+        self.assertIsInstance(context.exception, KeyError)
+
+    def test_missing_field_error_pickles(self):
+        # Errors raised in ProcessPoolExecutor workers are pickled back to the parent
+        error = pickle.loads(pickle.dumps(MissingFieldError("Info", "version")))
+        self.assertIsInstance(error, MissingFieldError)
+        self.assertEqual((error.class_name, error.field_name), ("Info", "version"))
+        self.assertEqual(str(error), 'missing value for field "Info.version"')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
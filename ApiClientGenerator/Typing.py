@@ -2,18 +2,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Literal
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     name: Optional[str]
     url: Optional[str]
     email: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class License:
     name: str
     url: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class Info:
     title: str
     description: Optional[str]
@@ -22,44 +22,44 @@ class Info:
     license: Optional[License]
     version: str
 
-@dataclass
+@dataclass(slots=True)
 class Tags:
     name: str
     description: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     description: str
     content: Optional[Dict[str, Dict[Literal["schema"], Schema]]]
 
-@dataclass
+@dataclass(slots=True)
 class ServerVariable:
     enum: Optional[List[str]]
     default: str
     description: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class Server:
     url: str
     description: Optional[str]
     variables: Optional[Dict[str, ServerVariable]]
 
-@dataclass
+@dataclass(slots=True)
 class ExternalDocumentation:
     description: Optional[str]
     url: str
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     name: str
     description: Optional[str]
     externalDocs: Optional[ExternalDocumentation]
 
-@dataclass
+@dataclass(slots=True)
 class Reference:
     ref: str
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     type: Optional[str]
     format: Optional[str]
@@ -82,7 +82,7 @@ class Property:
     deprecated: Optional[bool]
     ref: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class Schema:
     title: Optional[str]
     multipleOf: Optional[float]
@@ -121,14 +121,14 @@ class Schema:
     deprecated: Optional[bool]
     ref: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     in_: str
     name: str
     schema: Optional[Schema]
     required: Optional[bool]
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     summary: Optional[str] = None
     description: Optional[str] = None
@@ -138,14 +138,14 @@ class Operation:
     responses: Optional[Dict[str, Response]] = None
     tags: Optional[List[str]] = None
 
-@dataclass
+@dataclass(slots=True)
 class Path:
     summary: Optional[str] = None
     parameters: Optional[List[Parameter]] = None
     responses: Optional[Dict[str, Response]] = None
     tags: Optional[List[str]] = None
 
-@dataclass
+@dataclass(slots=True)
 class Components:
     schemas: Optional[Dict[str, Schema]]
     responses: Optional[Dict[str, Response]]
@@ -157,7 +157,7 @@ class Components:
     links: Optional[Dict[str, Any]]
     callbacks: Optional[Dict[str, Any]]
 
-@dataclass
+@dataclass(slots=True)
 class Methods:
     get: Optional[Path]
     put: Optional[Path]
@@ -168,7 +168,7 @@ class Methods:
     patch: Optional[Path]
     trace: Optional[Path]
 
-@dataclass
+@dataclass(slots=True)
 class OpenAPI:
     openapi: str
     info: Info
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import dataclasses
+import typing
+from typing import Any, Callable, Dict, Type
+
+try:
+    from . import Typing
+except ImportError:
+    # Imported as a top-level module, like the tests do
+    import Typing
+
+# Specialised constructors for the Typing dataclasses.
+#
+# dacite.from_dict resolves type hints and inspects every annotation again for each node it
+# builds, which dominates parsing time on large specs. Instead, the shape of every dataclass is
+# inspected once here and turned into a plain build_<Class>(data) function that only reads the
+# expected keys and recurses into nested dataclasses, lists and dicts.
+#
+# Missing optional fields become None (like dacite); a missing required field raises
+# MissingFieldError naming the class and field. Values are not type checked.
+
+_NONE_TYPE = type(None)
+
+
+class MissingFieldError(KeyError):
+    def __init__(self, class_name: str, field_name: str) -> None:
+        # Keep the constructor arguments as args so the error pickles across worker processes
+        super().__init__(class_name, field_name)
+        self.class_name = class_name
+        self.field_name = field_name
+
+    def __str__(self) -> str:
+        return f'missing value for field "{self.class_name}.{self.field_name}"'
+
+
+def _missing(class_name: str, field_name: str) -> Any:
+    raise MissingFieldError(class_name, field_name)
+
+
+def _is_dataclass_type(tp: Any) -> bool:
+    return isinstance(tp, type) and dataclasses.is_dataclass(tp)
+
+
+def _optional_inner(tp: Any) -> Any | None:
+    # Optional[X] -> X, anything else -> None
+    if typing.get_origin(tp) is typing.Union:
+        args = [arg for arg in typing.get_args(tp) if arg is not _NONE_TYPE]
+        if len(args) == 1 and len(args) != len(typing.get_args(tp)):
+            return args[0]
+    return None
+
+
+def _value_expression(tp: Any, source: str, depth: int = 0) -> str | None:
+    # Source that converts the value of `source`, or None when the value can be used as is
+    inner = _optional_inner(tp)
+    name = f"v{depth}"
+    if inner is not None:
+        converted = _value_expression(inner, name, depth + 1)
+        return None if converted is None else f"(None if ({name} := {source}) is None else {converted})"
+    if _is_dataclass_type(tp):
+        return f"build_{tp.__name__}({source})"
+    origin = typing.get_origin(tp)
+    if origin is list:
+        converted = _value_expression(typing.get_args(tp)[0], name, depth + 1)
+        return None if converted is None else f"[{converted} for {name} in {source}]"
+    if origin is dict:
+        converted = _value_expression(typing.get_args(tp)[1], name, depth + 1)
+        return None if converted is None else f"{{k{depth}: {converted} for k{depth}, {name} in {source}.items()}}"
+    return None
+
+
+def _builder_source(cls: Type) -> str:
+    hints = typing.get_type_hints(cls)
+    arguments = []
+    for field in dataclasses.fields(cls):
+        tp = hints[field.name]
+        if field.default is not dataclasses.MISSING and field.default is not None:
+            lookup = f"data.get({field.name!r}, {field.default!r})"
+        elif field.default is None or _optional_inner(tp) is not None:
+            lookup = f"data.get({field.name!r})"
+        else:
+            lookup = f"(data[{field.name!r}] if {field.name!r} in data else _missing({cls.__name__!r}, {field.name!r}))"
+        arguments.append(f"        {field.name}={_value_expression(tp, lookup) or lookup},")
+    return "\n".join((
+        f"def build_{cls.__name__}(data):",
+        f"    return {cls.__name__}(",
+        *arguments,
+        "    )",
+    ))
+
+
+def _generate_builders() -> Dict[Type, Callable[[Dict[str, Any]], Any]]:
+    classes = [value for value in vars(Typing).values() if _is_dataclass_type(value) and value.__module__ == Typing.__name__]
+    namespace: Dict[str, Any] = {cls.__name__: cls for cls in classes}
+    namespace["_missing"] = _missing
+    exec("\n\n".join(_builder_source(cls) for cls in classes), namespace)
+    return {cls: namespace[f"build_{cls.__name__}"] for cls in classes}
+
+
+builders = _generate_builders()
+build_OpenAPI = builders[Typing.OpenAPI]
@@ -14,6 +14,7 @@ if __name__ == "__main__":
     parser.add_argument("--output", "-o", type=str, help="Output folder")
     parser.add_argument("--python", "-py", nargs='*', help="Enable Python clients")
     parser.add_argument("--javascript", "-js", nargs='*', help="Enable JavaScript clients")
+    parser.add_argument("--slots", action="store_true", help="Emit slotted dataclasses in Python clients (generated clients then require Python 3.10+)")
 
     args = parser.parse_args()
 
@@ -27,6 +28,8 @@ if __name__ == "__main__":
     if args.javascript:
         for client in args.javascript:
             settings.Javascript[client] = True
+
+    settings.PythonSlots = args.slots
     
     print(f"Input folder: {input_folder}")
     print(f"Output folder: {output_folder}")
@@ -1,46 +1,108 @@
 import json
-import jinja2
-from glob import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
+import re
+import uuid
 import logging
 from typing import Any, Dict
-from dacite import from_dict, Config
 
 from .Generators import Python as P, JavaScript as JS
-from . import Typing
+from .Typing_codegen import build_OpenAPI
 
+try:
+    # Optional, considerably faster decoder
+    import orjson
+except ImportError:
+    orjson = None
 
-logging.basicConfig(level=logging.DEBUG)
+# orjson turns integers wider than 64 bits into floats, so specs with long digit runs are left to json
+_LONG_NUMBER_RE = re.compile(rb'\d{19}')
+
+
+def json_loads(raw: bytes) -> Any:
+    if orjson is None or _LONG_NUMBER_RE.search(raw):
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # NaN/Infinity and unpaired surrogates are rejected by orjson but accepted by json
+        return json.loads(raw)
+
+
+# Default to WARNING so the per-type/per-method debug records are skipped unless asked for
+_log_level = (os.environ.get("APICLIENTGENERATOR_LOG_LEVEL") or "WARNING").upper()
+_known_log_level = _log_level in logging.getLevelNamesMapping()
+logging.basicConfig(level=_log_level if _known_log_level else logging.WARNING)
 logger = logging.getLogger(__name__)
+if not _known_log_level:
+    # A typo in the variable shouldn't make the package unimportable
+    logger.warning("Unknown APICLIENTGENERATOR_LOG_LEVEL %r, using WARNING", _log_level)
+
+
+_RENAMED_KEYS = {"$ref": "ref", "in": "in_"}
 
 
 def ref_key_transformer(data: Any) -> Any:
-    if isinstance(data, dict):
-        return {("ref" if k == "$ref" else ("in_" if k == "in" else k)): ref_key_transformer(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [ref_key_transformer(item) for item in data]
-    else:
-        return data
+    # Renames the keys in place with an explicit stack, so large specs are neither copied
+    # nor limited by the recursion depth
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "$ref" in node or "in" in node:
+                # Rebuild the dict so the renamed keys keep their position
+                items = list(node.items())
+                node.clear()
+                node.update((_RENAMED_KEYS.get(k, k), v) for k, v in items)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return data
+
+def _list_specs(input_folder: str) -> list[str]:
+    # The directory entries already know their type, so no stat per file (unlike glob)
+    if not os.path.isdir(input_folder):
+        return []
+    with os.scandir(input_folder) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
 
 class Settings:
     Python: Dict[str, bool] = {}
     Javascript: Dict[str, bool] = {}
+    # Emit @dataclass(slots=True) in Python clients; the generated code then requires Python 3.10+
+    PythonSlots: bool = False
+
+
+_logging_configured = False
+
+
+def _configure_logging(logging_enabled: bool) -> None:
+    # Also used as the worker initializer, so spawned workers log the same way as the parent.
+    # Forked workers inherit the handlers and the flag, so nothing is added twice.
+    global _logging_configured
+    if not logging_enabled or _logging_configured:
+        return
+    _logging_configured = True
+    logger.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # File logging
+    fh = logging.FileHandler('ApiClientGenerator.log')
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+    logger.addHandler(fh)
+    # Stdout logging
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    ch.setFormatter(formatter)
+    logger.addHandler(ch)
 
 
 def main(input_folder: str|None=None, output_folder:str|None=None, settings: Settings|None=None, logging_enabled: bool=False) -> None:
     logger.info("Starting client generation")
-    if(logging_enabled):
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        # File logging
-        fh = logging.FileHandler('ApiClientGenerator.log')
-        fh.setLevel(logging.DEBUG)
-        fh.setFormatter(formatter)
-        logger.addHandler(fh)
-        # Stdout logging
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.DEBUG)
-        ch.setFormatter(formatter)
-        logger.addHandler(ch)
+    _configure_logging(logging_enabled)
         
     if input_folder is None:
         input_folder = "ToBeGenerated"
@@ -49,40 +111,96 @@ def main(input_folder: str|None=None, output_folder:str|None=None, settings: Set
     if settings is None:
         settings = Settings()
     
-    # Loop over all the to be generated clients
-    for file in glob(f"{input_folder}/*.json"):
-        logger.info(f"Processing file: {file}")
-
-        # Load the file
-        with open(file, "r") as f:
-            data = json.load(f)
-            # Modify $ref keys to ref and in keys to in_ recursively
+    # Collect all the to be generated clients
+    jobs = []
+    for file in _list_specs(input_folder):
+        file_name = os.path.basename(file)[:-5]
+        python_enabled = "*" in settings.Python or settings.Python.get(file_name, False)
+        javascript_enabled = "*" in settings.Javascript or settings.Javascript.get(file_name, False)
+        # Don't load and parse specs that no client is generated for
+        if not (python_enabled or javascript_enabled):
+            logger.info("Skipping file without enabled clients: %s", file)
+            continue
+        jobs.append((file, output_folder, python_enabled, javascript_enabled, settings.PythonSlots))
+
+    if len(jobs) <= 1:
+        for job in jobs:
+            generate_file(*job)
+        return
+
+    # Every spec is independent, so spread them over worker processes. Specs whose titles
+    # sanitize to the same folder would write the same client files, so workers render into
+    # temporary files and the results are moved into place here in listing order (last one wins).
+    results: list = [None] * len(jobs)
+    errors: list = [None] * len(jobs)
+    with ProcessPoolExecutor(
+        max_workers=min(len(jobs), os.cpu_count() or 1),
+        initializer=_configure_logging,
+        initargs=(logging_enabled,),
+    ) as executor:
+        futures = {executor.submit(generate_file, *job, staged=True): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                errors[index] = error
+
+    for staged_files in results:
+        for temporary_path, client_path in staged_files or ():
+            os.replace(temporary_path, client_path)
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def generate_file(file: str, output_folder: str, python_enabled: bool, javascript_enabled: bool, python_slots: bool = False, staged: bool = False) -> list[tuple[str, str]]:
+    # With staged=True the clients are written to temporary files next to their destination and
+    # the (temporary path, client path) pairs are returned for the caller to move into place
+    logger.info("Processing file: %s", file)
+
+    # Load the file
+    with open(file, "rb") as f:
+        raw = f.read()
+        data = json_loads(raw)
+        # Modify $ref keys to ref and in keys to in_ recursively, unless the spec has neither
+        if b'"$ref"' in raw or b'"in"' in raw:
             data = ref_key_transformer(data)
-            # logger.debug(f"Transformed data: {data}")
-            config = Config()
-            parsed_data = from_dict(data_class=Typing.OpenAPI, data=data, config=config)
+        # logger.debug(f"Transformed data: {data}")
+        # Specialised constructors generated from the Typing dataclasses, no per-node reflection
+        parsed_data = build_OpenAPI(data)
 
-        # Load the template folder
-        folder_dir = os.path.dirname(os.path.realpath(__file__))
-        logger.debug(f"Folder directory: {folder_dir}")
+    file_name = os.path.basename(file)[:-5]
+    print(f"Generating client for {file_name}")
 
-        file_name = os.path.basename(file)[:-5]
-        print(f"Generating client for {file_name}")
+    generators = []
+    # Generate Python client if enabled in settings
+    if python_enabled:
+        generators.append(P(parsed_data, P.get_template(), logger, output_folder, python_slots))
 
-        # Generate Python client if enabled in settings
-        if "*" in settings.Python or (file_name in settings.Python and settings.Python[file_name]):
-            with open(os.path.join(folder_dir, "templates", "Python.jinja2"), "r") as f:
-                template = jinja2.Template(f.read())
-            generator = P(parsed_data, template, logger, output_folder)
-            generator.generate()
+    # Generate JavaScript client if enabled in settings
+    if javascript_enabled:
+        generators.append(JS(parsed_data, JS.get_template(), logger, output_folder))
 
-        # Generate JavaScript client if enabled in settings
-        if "*" in settings.Javascript or (file_name in settings.Javascript and settings.Javascript[file_name]):
-            with open(os.path.join(folder_dir, "templates", "Javascript.jinja2"), "r") as f:
-                template = jinja2.Template(f.read())
-            generator = JS(parsed_data, template, logger, output_folder)
+    staged_files = []
+    try:
+        for generator in generators:
+            if staged:
+                client_path = generator.client_path
+                generator.client_path = f"{client_path}.{uuid.uuid4().hex}.tmp"
             generator.generate()
-    
+            # Nothing is written when a spec has no types
+            if staged and os.path.exists(generator.client_path):
+                staged_files.append((generator.client_path, client_path))
+    except BaseException:
+        # Don't leave the temporary files of a failed spec behind
+        for temporary_path, _ in staged_files:
+            os.remove(temporary_path)
+        if staged and os.path.exists(generator.client_path):
+            os.remove(generator.client_path)
+        raise
+    return staged_files
+
 if __name__ == "__main__":
     # Set current working directory to the directory of the script
     os.chdir(os.path.dirname(os.path.realpath(__file__)))